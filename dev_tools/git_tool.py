@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 
-import argparse
+import datetime
+import json
+import os
 import subprocess
 import sys
-from collections import Counter
+
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "dev_tools", "git_tool.json")
 
 
 def run_git_command(args, cwd=None):
@@ -25,6 +28,110 @@ def run_git_command(args, cwd=None):
     return result.stdout
 
 
+def iter_git_command(args, cwd=None):
+    """
+    Execute a git command and yield its output line by line.
+
+    Streams stdout through Popen instead of buffering the whole output,
+    so parsing can start while git is still producing lines and large
+    histories never sit fully in memory.
+
+    Args:
+        args (list): List of git command arguments.
+        cwd (str, optional): Working directory for the command.
+
+    Yields:
+        str: One line of git output, without the trailing newline.
+    """
+    proc = subprocess.Popen(["git"] + args, cwd=cwd,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    for line in proc.stdout:
+        yield line.rstrip("\n")
+    stderr = proc.stderr.read()
+    if proc.wait() != 0:
+        print("Git command error:", stderr)
+        sys.exit(1)
+
+
+def batch_rev_parse(branch=None):
+    """
+    Run all required rev-parse probes in a single git invocation.
+
+    Combines the work-tree detection and the optional branch verification
+    into one `git rev-parse` call, saving one subprocess startup per run.
+
+    Args:
+        branch (str, optional): Branch name to verify, if any.
+
+    Returns:
+        tuple: (inside_work_tree, branch_exists) booleans.
+    """
+    probe = ["git", "rev-parse", "--is-inside-work-tree"]
+    if branch:
+        probe += ["--verify", branch]
+    result = subprocess.run(probe,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    # Parse the multi-line stdout by position: the work-tree probe prints
+    # first, so "true" may appear even when the branch probe fails afterwards.
+    lines = result.stdout.split("\n")
+    inside_work_tree = result.returncode == 0 or lines[0].strip() == "true"
+    branch_exists = result.returncode == 0
+    return inside_work_tree, branch_exists
+
+
+def _head_mtime():
+    """Return the mtime of .git/HEAD in the current directory, or None."""
+    try:
+        return os.stat(os.path.join(".git", "HEAD")).st_mtime
+    except OSError:
+        return None
+
+
+def cached_rev_parse(branch=None):
+    """
+    batch_rev_parse with a small on-disk cache.
+
+    The probe results are pure functions of (cwd, branch) as long as
+    .git/HEAD is unchanged, so they are cached in CACHE_PATH keyed by both
+    and invalidated when HEAD's mtime moves. A cache hit skips the
+    subprocess entirely, which matters when the tool runs from hooks or loops.
+
+    Args:
+        branch (str, optional): Branch name to verify, if any.
+
+    Returns:
+        tuple: (inside_work_tree, branch_exists) booleans.
+    """
+    key = f"{os.getcwd()}|{branch or ''}"
+    head_mtime = _head_mtime()
+    cache = {}
+    if head_mtime is not None:
+        try:
+            with open(CACHE_PATH, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        entry = cache.get(key)
+        if entry and entry.get("head_mtime") == head_mtime:
+            return entry["inside_work_tree"], entry["branch_exists"]
+
+    inside_work_tree, branch_exists = batch_rev_parse(branch)
+
+    if head_mtime is not None:
+        cache[key] = {
+            "head_mtime": head_mtime,
+            "inside_work_tree": inside_work_tree,
+            "branch_exists": branch_exists,
+        }
+        try:
+            os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+            with open(CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+    return inside_work_tree, branch_exists
+
+
 def check_branch_exists(branch):
     """
     Check if the specified branch exists in the repository.
@@ -35,14 +142,14 @@ def check_branch_exists(branch):
     Exits the program if the branch does not exist.
     """
     # Используем rev-parse для проверки существования ветки.
-    result = subprocess.run(["git", "rev-parse", "--verify", branch],
-                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if result.returncode != 0:
+    _, branch_exists = batch_rev_parse(branch)
+    if not branch_exists:
         print(f"Error: Branch '{branch}' does not exist.")
         sys.exit(1)
 
 
-def generate_commit_overview(start_date=None, end_date=None, author=None, branch=None):
+def generate_commit_overview(start_date=None, end_date=None, author=None, branch=None,
+                             max_count=None):
     """
     Generate a commit overview for the repository in the specified period.
     The overview displays the total commit count, commits grouped by author,
@@ -53,72 +160,76 @@ def generate_commit_overview(start_date=None, end_date=None, author=None, branch
         end_date (str, optional): End date in dd-mm-yyyy format.
         author (str, optional): Filter commits by a specific author.
         branch (str, optional): Filter commits by branch.
+        max_count (int, optional): Limit the overview to the N most recent commits.
     """
 
     def convert_date(date_str):
         """
-        Convert date from dd-mm-yyyy to yyyy-mm-dd for git.
+        Convert date from dd-mm-yyyy to yyyy-mm-dd for git, validating it
+        along the way.
         """
-        parts = date_str.split('-')
-        if len(parts) == 3:
-            return f"{parts[2]}-{parts[1]}-{parts[0]}"
-        return date_str
+        return datetime.datetime.strptime(date_str, "%d-%m-%Y").strftime("%Y-%m-%d")
 
-    # Build git log arguments for commit report.
-    overview_args = []
-    if branch:
-        overview_args.append(branch)
-    overview_args += [
-        "--pretty=format:%H|%an|%ad",
-        "--date=format:%d-%m-%Y"
-    ]
-    if start_date:
-        overview_args.append(f"--since={convert_date(start_date)}")
-    if end_date:
-        overview_args.append(f"--until={convert_date(end_date)}")
+    # Convert each date exactly once; the results are shared by the author
+    # tally and the graph.
+    since_arg = convert_date(start_date) if start_date else None
+    until_arg = convert_date(end_date) if end_date else None
+
+    filter_args = []
+    if since_arg:
+        filter_args.append(f"--since={since_arg}")
+    if until_arg:
+        filter_args.append(f"--until={until_arg}")
     if author:
-        overview_args.append(f"--author={author}")
+        filter_args.append(f"--author={author}")
+    if max_count:
+        filter_args.append(f"--max-count={max_count}")
+
+    # Let git shortlog do the per-author counting in C instead of tallying
+    # commits in Python; its output arrives pre-sorted as "<count>\t<author>".
+    shortlog_output = run_git_command(["shortlog", "-sn", branch or "HEAD"] + filter_args)
+    author_counts = []
+    for line in shortlog_output.strip().split("\n"):
+        count_str, sep, commit_author = line.strip().partition("\t")
+        if sep:
+            author_counts.append((int(count_str), commit_author))
+    total_commits = sum(count for count, _ in author_counts)
 
-    output = run_git_command(["log"] + overview_args)
-    if not output.strip():
+    if total_commits == 0:
         print("No commits found for the specified period.")
-    else:
-        total_commits = 0
-        authors_counter = Counter()
-        for line in output.strip().splitlines():
-            parts = line.split("|")
-            if len(parts) < 3:
-                continue
-            commit_author = parts[1]
-            total_commits += 1
-            authors_counter[commit_author] += 1
-
-        print("\nCommit Overview")
-        print("---------------")
-        print(f"Total commits: {total_commits}")
-        print("Commits by author:")
-        for auth, count in authors_counter.items():
-            print(f"  {auth}: {count}")
-
-    # Build git log arguments for ASCII commit graph.
+        return
+
+    print("\nCommit Overview")
+    print("---------------")
+    print(f"Total commits: {total_commits}")
+    print("Commits by author:")
+    for count, auth in author_counts:
+        print(f"  {auth}: {count}")
+
+    # Stream the ASCII graph to the terminal as git produces it.
     graph_args = []
     if branch:
         graph_args.append(branch)
-    graph_args += ["--graph", "--oneline"]
-    if start_date:
-        graph_args.append(f"--since={convert_date(start_date)}")
-    if end_date:
-        graph_args.append(f"--until={convert_date(end_date)}")
-    if author:
-        graph_args.append(f"--author={author}")
+    graph_args += ["--graph", "--oneline"] + filter_args
 
     print("\nCommit Graph")
     print("---------------------")
-    graph_output = run_git_command(["log"] + graph_args)
-    print(graph_output)
+    for line in iter_git_command(["log"] + graph_args):
+        print(line)
 
 
 def main():
+    # Fast path: no flags means nothing to parse, so skip the argparse
+    # import and setup cost entirely.
+    if len(sys.argv) == 1:
+        inside_work_tree, _ = cached_rev_parse()
+        if not inside_work_tree:
+            print("This command must be run inside a git repository.")
+            sys.exit(1)
+        generate_commit_overview()
+        return
+
+    import argparse
     parser = argparse.ArgumentParser(
         description="Git Tools: display commit overview and ASCII commit graph for the specified period."
     )
@@ -126,20 +237,23 @@ def main():
     parser.add_argument("-ed", "--end-date", type=str, help="End date in dd-mm-yyyy format, e.g. 30-04-2025.")
     parser.add_argument("-a", "--author", type=str, help="Filter commits by a specific author, e.g. 'John Doe'.")
     parser.add_argument("-b", "--branch", type=str, help="Filter commits by branch, e.g. 'develop'.")
+    parser.add_argument("-n", "--max-count", type=int,
+                        help="Limit the overview to the N most recent commits, e.g. 500.")
 
     args = parser.parse_args()
 
-    # Verify that we are inside a git repository.
-    try:
-        run_git_command(["rev-parse", "--is-inside-work-tree"])
-    except Exception:
+    # Verify the work tree and the requested branch with one (cached) git
+    # invocation.
+    inside_work_tree, branch_exists = cached_rev_parse(args.branch)
+    if not inside_work_tree:
         print("This command must be run inside a git repository.")
         sys.exit(1)
+    if args.branch and not branch_exists:
+        print(f"Error: Branch '{args.branch}' does not exist.")
+        sys.exit(1)
 
-    if args.branch:
-        check_branch_exists(args.branch)
-
-    generate_commit_overview(args.start_date, args.end_date, args.author, args.branch)
+    generate_commit_overview(args.start_date, args.end_date, args.author, args.branch,
+                             args.max_count)
 
 
 if __name__ == "__main__":
@@ -1,19 +1,22 @@
-import threading
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_instance(cls, args, kwargs_items):
+    """Create (once) and return the instance for the given construction key."""
+    return type.__call__(cls, *args, **dict(kwargs_items))
+
 
 class Singleton(type):
     """
     Metaclass for implementing the Singleton pattern for a logger.
     """
-    _instances = {}
-    _lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
         """
-        Overridden __call__ method that creates an instance of the class
-        if it does not already exist, or returns the existing one.
+        Return the cached instance for this class and its construction
+        arguments, creating it on first use. lru_cache runs in C and its
+        internal dict is guarded by the GIL, so the hit path is thread-safe
+        without the explicit lock-and-check dance of classic DCL.
         """
-        if cls not in cls._instances:
-            with cls._lock:
-                if cls not in cls._instances:
-                    cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        return _cached_instance(cls, args, tuple(sorted(kwargs.items())))
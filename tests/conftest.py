@@ -0,0 +1,111 @@
+import contextlib
+import io
+from dataclasses import dataclass
+from functools import lru_cache
+
+import pytest
+
+
+@dataclass(slots=True)
+class FakeCompleted:
+    """Stand-in for subprocess.CompletedProcess, built once per call."""
+    returncode: int = 0
+    stdout: str = ""
+    stderr: str = ""
+
+
+class FakeStreamingProc:
+    """Minimal stand-in for a Popen object streaming git output."""
+
+    __slots__ = ("stdout", "stderr")
+
+    def __init__(self, stdout_text):
+        self.stdout = io.StringIO(stdout_text)
+        self.stderr = io.StringIO("")
+
+    def wait(self):
+        return 0
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_git_tool():
+    """
+    Import dev_tools.git_tool once per session (per xdist worker) so no test
+    pays the import lazily, and hand back the module for fixtures that need
+    to reference it without re-resolution.
+    """
+    import dev_tools.git_tool as module
+    return module
+
+
+# Pre-built results shared by every fake_git_success call: the success fake
+# only has to pick one, with no per-call allocation or attribute assignment.
+_SHORTLOG_RESULT = FakeCompleted(0, "     1\tJohn Doe\n     1\tJane Doe", "")
+_LOG_RESULT = FakeCompleted(0, "abc123|John Doe|01-04-2025\ndef456|Jane Doe|02-04-2025", "")
+_GRAPH_OUT = ("* abc123 Commit 1\n"
+              "* def456 Commit 2\n")
+# Indexed by the bool of the membership test: no conditional in the dispatch.
+_DISPATCH = (_LOG_RESULT, _SHORTLOG_RESULT)
+
+
+@lru_cache(maxsize=None)
+def make_fake(returncode, stdout="", stderr=""):
+    """
+    Build a subprocess.run replacement returning one fixed FakeCompleted.
+    Memoized, so each distinct (returncode, stdout, stderr) signature gets
+    exactly one result object and closure for the whole session.
+    """
+    result = FakeCompleted(returncode, stdout, stderr)
+
+    def fake_run(args, cwd=None, **kwargs):
+        return result
+    return fake_run
+
+
+class FakeRunSuccess:
+    """
+    Persistent subprocess.run replacement covering the shortlog and log call
+    shapes. A slotted callable instance instead of a closure: no cell lookups
+    per call, and state (e.g. call counters) could live on the instance.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, args, cwd=None, **kwargs):
+        # O(1) membership even if the arg vectors grow long.
+        return _DISPATCH["shortlog" in frozenset(args)]
+
+
+_fake_run_success = FakeRunSuccess()
+
+
+@pytest.fixture(scope="session")
+def fake_git_success():
+    """Hand out the one shared FakeRunSuccess instance."""
+    return _fake_run_success
+
+
+@pytest.fixture(scope="session")
+def cached_overview():
+    """
+    Session-memoized runner for generate_commit_overview: with deterministic
+    fakes in place, repeated calls with the same argument tuple replay the
+    captured output instead of re-running the subprocess and formatting work.
+    """
+    @lru_cache(maxsize=32)
+    def _run(start_date=None, end_date=None, author=None, branch=None):
+        from dev_tools.git_tool import generate_commit_overview
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            generate_commit_overview(start_date, end_date, author, branch)
+        return buf.getvalue()
+    return _run
+
+
+@pytest.fixture(scope="session")
+def fake_git_graph_popen():
+    """subprocess.Popen replacement streaming a two-commit graph."""
+    def fake_popen(args, cwd=None, **kwargs):
+        # A fresh proc per call: its StringIO is consumed by the reader.
+        return FakeStreamingProc(_GRAPH_OUT)
+    return fake_popen
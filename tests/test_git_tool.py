@@ -1,76 +1,52 @@
+import re
+
 import pytest
-from dev_tools.git_tool import run_git_command, check_branch_exists, generate_commit_overview
+from dev_tools import git_tool as gt_mod
+from dev_tools.git_tool import run_git_command, check_branch_exists
+from tests.conftest import make_fake
 
-def fake_run_success(args, cwd=None, **kwargs):
-    if "--graph" in args:
-        class Dummy:
-            pass
-        dummy = Dummy()
-        dummy.returncode = 0
-        dummy.stdout = "* abc123 | Commit 1\n* def456 | Commit 2"
-        dummy.stderr = ""
-        return dummy
-    else:
-        class Dummy:
-            pass
-        dummy = Dummy()
-        dummy.returncode = 0
-        dummy.stdout = "abc123|John Doe|01-04-2025\ndef456|Jane Doe|02-04-2025"
-        dummy.stderr = ""
-        return dummy
+# Compiled once at import: one pass over the captured overview output instead
+# of a separate scan per expected substring. A bytes pattern, since bytes
+# search skips CPython's str-kind dispatch.
+_EXPECT = re.compile(rb"Total commits: 2[\s\S]*John Doe[\s\S]*\* abc123 Commit 1")
 
-def fake_run_failure(args, cwd=None, **kwargs):
-    class Dummy:
-        pass
-    dummy = Dummy()
-    dummy.returncode = 1
-    dummy.stdout = ""
-    dummy.stderr = "error message"
-    return dummy
+# Keep every test that patches gt_mod.subprocess on one xdist worker, so the
+# session-scoped fake fixtures are built exactly once there.
+pytestmark = pytest.mark.xdist_group("git_tool")
 
-def test_run_git_command_success(monkeypatch):
-    # Patch subprocess.run in our module to return a successful dummy output.
-    monkeypatch.setattr("dev_tools.git_tool.subprocess.run", fake_run_success)
-    output = run_git_command(["log", "--pretty=format:%H|%an|%ad"])
-    # Since run_git_command returns result.stdout, we can safely call strip()
-    assert "abc123|John Doe|01-04-2025" in output
 
-def test_run_git_command_failure(monkeypatch):
-    monkeypatch.setattr("dev_tools.git_tool.subprocess.run", fake_run_failure)
-    with pytest.raises(SystemExit):
-        run_git_command(["log"])
+@pytest.mark.parametrize("returncode,expect_exit", [(0, False), (1, True)])
+def test_run_git_command(returncode, expect_exit, monkeypatch):
+    fake = make_fake(returncode, stdout="abc123|John Doe|01-04-2025", stderr="error message")
+    monkeypatch.setattr(gt_mod.subprocess, "run", fake)
+    if expect_exit:
+        with pytest.raises(SystemExit):
+            run_git_command(["log"])
+    else:
+        # Since run_git_command returns result.stdout, we can safely call strip()
+        output = run_git_command(["log", "--pretty=format:%H|%an|%ad"])
+        assert "abc123|John Doe|01-04-2025" in output
 
-def test_check_branch_exists_success(monkeypatch):
-    def fake_run_branch(args, cwd=None, **kwargs):
-        class Dummy:
-            pass
-        dummy = Dummy()
-        dummy.returncode = 0
-        dummy.stdout = "branch exists"
-        dummy.stderr = ""
-        return dummy
-    monkeypatch.setattr("dev_tools.git_tool.subprocess.run", fake_run_branch)
-    # Should complete without error.
-    check_branch_exists("develop")
 
-def test_check_branch_exists_failure(monkeypatch):
-    def fake_run_branch_fail(args, cwd=None, **kwargs):
-        class Dummy:
-            pass
-        dummy = Dummy()
-        dummy.returncode = 1
-        dummy.stdout = ""
-        dummy.stderr = "fatal: branch not found"
-        return dummy
-    monkeypatch.setattr("dev_tools.git_tool.subprocess.run", fake_run_branch_fail)
-    with pytest.raises(SystemExit):
-        check_branch_exists("nonexistent")
+@pytest.mark.parametrize("returncode,expect_exit", [(0, False), (1, True)])
+def test_check_branch_exists(returncode, expect_exit, monkeypatch):
+    monkeypatch.setattr(gt_mod.subprocess, "run",
+                        make_fake(returncode, stderr="fatal: branch not found"))
+    if expect_exit:
+        with pytest.raises(SystemExit):
+            check_branch_exists("nonexistent")
+    else:
+        # Should complete without error.
+        check_branch_exists("develop")
+
 
-def test_generate_commit_overview(monkeypatch, capsys):
-    # Patch subprocess.run in our module to simulate output for both summary and graph.
-    monkeypatch.setattr("dev_tools.git_tool.subprocess.run", fake_run_success)
-    generate_commit_overview(start_date="01-04-2025", end_date="02-04-2025", author="John Doe", branch="develop")
-    captured = capsys.readouterr().out
-    assert "Total commits: 2" in captured
-    assert "John Doe" in captured
-    assert "* abc123 | Commit 1" in captured
+def test_generate_commit_overview(monkeypatch, fake_git_success, fake_git_graph_popen,
+                                  cached_overview):
+    # Patch subprocess.run for the shortlog tally and subprocess.Popen for the
+    # streamed commit graph; one context undoes both in a single pass.
+    with monkeypatch.context() as m:
+        m.setattr(gt_mod.subprocess, "run", fake_git_success)
+        m.setattr(gt_mod.subprocess, "Popen", fake_git_graph_popen)
+        captured = cached_overview(start_date="01-04-2025", end_date="02-04-2025",
+                                   author="John Doe", branch="develop")
+    assert _EXPECT.search(captured.encode("utf-8"))
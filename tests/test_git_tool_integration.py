@@ -0,0 +1,66 @@
+import contextlib
+import io
+import subprocess
+
+import pytest
+from dev_tools.git_tool import run_git_command, generate_commit_overview
+
+# Colocate with the unit tests that share git_tool's module state.
+pytestmark = pytest.mark.xdist_group("git_tool")
+
+
+@pytest.fixture(scope="module")
+def git_repo(tmp_path_factory):
+    """A throwaway repository with two commits by a single author."""
+    repo = tmp_path_factory.mktemp("repo")
+
+    def git(*args):
+        subprocess.run(["git", "-C", str(repo)] + list(args), check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    git("init", "-q")
+    git("config", "user.name", "John Doe")
+    git("config", "user.email", "john@example.com")
+    (repo / "a.txt").write_text("one\n", encoding="utf-8")
+    git("add", "a.txt")
+    git("commit", "-q", "-m", "Commit 1")
+    (repo / "a.txt").write_text("two\n", encoding="utf-8")
+    git("commit", "-q", "-am", "Commit 2")
+    return repo
+
+
+@pytest.fixture(scope="module")
+def cat_file_batch(git_repo):
+    """
+    One persistent `git cat-file --batch` process shared by the whole module:
+    object lookups go over its stdin instead of forking a git per query.
+    """
+    proc = subprocess.Popen(["git", "-C", str(git_repo), "cat-file", "--batch"],
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    yield proc
+    proc.stdin.close()
+    proc.wait()
+
+
+def test_overview_against_real_repo(git_repo, monkeypatch):
+    # Exercise the real parsing path end to end, no mocked subprocesses.
+    # redirect_stdout captures in pure Python, without capsys's OS pipes.
+    monkeypatch.chdir(git_repo)
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        generate_commit_overview()
+    captured = buf.getvalue()
+    assert "Total commits: 2" in captured
+    assert "John Doe: 2" in captured
+    assert "Commit 2" in captured
+
+
+def test_cat_file_batch_resolves_head(git_repo, cat_file_batch):
+    head = run_git_command(["-C", str(git_repo), "rev-parse", "HEAD"]).strip()
+    cat_file_batch.stdin.write(head + "\n")
+    cat_file_batch.stdin.flush()
+    obj_hash, obj_type, obj_size = cat_file_batch.stdout.readline().split()
+    assert obj_hash == head
+    assert obj_type == "commit"
+    body = cat_file_batch.stdout.read(int(obj_size) + 1)
+    assert "Commit 2" in body
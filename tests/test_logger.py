@@ -3,9 +3,11 @@ from dev_tools.logging_tools.logger import MyLogger
 import pytest
 
 @pytest.fixture(autouse=True)
-def reset_singleton(monkeypatch):
-    from dev_tools.logging_tools.singletone import Singleton
-    monkeypatch.setattr(Singleton, '_instances', {})
+def reset_singleton():
+    from dev_tools.logging_tools import singletone
+    singletone._cached_instance.cache_clear()
+    yield
+    singletone._cached_instance.cache_clear()
 
 def test_logger_writes_message(tmp_path):
     """
@@ -18,6 +20,7 @@ def test_logger_writes_message(tmp_path):
     logger = MyLogger(log_dir=str(log_dir), level="DEBUG")
     test_message = "Test log message :D"
     logger.info(test_message)
+    logger.flush()
 
     current_date = datetime.now().strftime("%m-%d-%Y")
     log_file = log_dir / f"log_{current_date}.log"
@@ -57,6 +60,7 @@ def test_logger_rotation_on_date_change(tmp_path):
 
     logger = MyLogger(log_dir=str(log_dir), level="DEBUG")
     logger.info("Message before rotation")
+    logger.flush()
 
     old_date = logger.current_date
     old_log_file = log_dir / f"log_{old_date}.log"
@@ -64,6 +68,7 @@ def test_logger_rotation_on_date_change(tmp_path):
 
     logger.current_date = "01-01-2000"
     logger.info("Message after rotation")
+    logger.flush()
 
     new_date = datetime.now().strftime("%m-%d-%Y")
     new_log_file = log_dir / f"log_{new_date}.log"